@@ -1,51 +1,387 @@
-from os.path import join
-from cachetools import cached, TTLCache
+import orjson
+import os
+import threading
+from concurrent.futures import Future
+from functools import lru_cache, wraps
+from itertools import islice
+from typing import Any
+from urllib.parse import urlencode
+from cachetools.keys import hashkey
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from gdacs.schemas import GeoJSON
 from gdacs.utils import *
 from pygeoif.factories import from_wkt
 
+try:
+    import httpx
+except ImportError:  # async support is optional, see `pip install gdacs-api[async]`
+    httpx = None
+
+try:
+    import ijson
+except ImportError:  # streaming support is optional, see `pip install gdacs-api[stream]`
+    ijson = None
+
 
 CACHE_TTL = 300  # secs
-EVENT_TYPES = [None, 'TC', 'EQ', 'FL', 'VO', 'DR', 'WF']
-DATA_FORMATS = [None, 'xml', 'geojson', 'shp']
-ALERT_LEVELS = [None, 'green', 'orange', 'red']
+DEFAULT_CACHE_SIZE = 500  # entries per endpoint cache
+EVENT_TYPES = frozenset({None, 'TC', 'EQ', 'FL', 'VO', 'DR', 'WF'})
+DATA_FORMATS = frozenset({None, 'xml', 'geojson', 'shp'})
+ALERT_LEVELS = frozenset({None, 'green', 'orange', 'red'})
 BASE_URL = "https://www.gdacs.org/datareport/resources"
 API_BASE_URL = "https://www.gdacs.org/gdacsapi"
 LATEST_EVENTS_URL = f"{API_BASE_URL}/api/events/geteventlist/latest"
 LATEST_EVENTS_URL_4APP = f"{API_BASE_URL}/api/events/geteventlist/EVENTS4APP"
 EVENTS_BY_AREA_URL = f"{API_BASE_URL}/api/events/geteventlist/eventsbyarea"
 EVENTS_DATA_URL = f"{API_BASE_URL}/api/events/geteventdata"
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 20
+WARMUP_TIMEOUT = 2  # secs
+ERROR_TEXT_LIMIT = 200  # chars of response text quoted in GDACSAPIError
+ASYNC_MAX_KEEPALIVE_CONNECTIONS = 20
+ASYNC_MAX_CONNECTIONS = 100
+
+
+def _cache_size_from_env() -> int:
+    """ Read `GDACS_CACHE_SIZE`, falling back to the default for a missing or invalid value. """
+    try:
+        size = int(os.environ.get('GDACS_CACHE_SIZE', DEFAULT_CACHE_SIZE))
+    except ValueError:
+        return DEFAULT_CACHE_SIZE
+    return size if size >= 0 else DEFAULT_CACHE_SIZE
+
+
+CACHE_SIZE = _cache_size_from_env()
+
+
+def _cached_request(cache_name: str):
+    """
+    Memoize a reader method in its per-instance cache `cache_name`, keyed on the call
+    arguments only, and record hits and misses on it. Concurrent misses on the same key
+    share one upstream request: the first caller fetches, the others wait on its Future
+    and reuse the result.
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = getattr(self, cache_name)
+            key = hashkey(*args, **kwargs)
+            flight_key = (cache_name, key)
+
+            with self._cache_lock:
+                try:
+                    value = cache[key]
+                except KeyError:
+                    cache.misses += 1
+                else:
+                    cache.hits += 1
+                    return value
+                future = self._inflight.get(flight_key)
+                if future is None:
+                    future = self._inflight[flight_key] = Future()
+                    leader = True
+                else:
+                    leader = False
+
+            if not leader:
+                return future.result()
+
+            try:
+                value = method(self, *args, **kwargs)
+            except BaseException as error:
+                with self._cache_lock:
+                    del self._inflight[flight_key]
+                future.set_exception(error)
+                raise
+
+            with self._cache_lock:
+                try:
+                    cache[key] = value
+                except ValueError:
+                    pass  # value too large
+                del self._inflight[flight_key]
+            future.set_result(value)
+            return value
+        return wrapper
+    return decorator
+
+
+def _validate_event_type(event_type: str = None):
+    """ Raise if `event_type` is not a known GDACS event type. """
+    if event_type not in EVENT_TYPES:
+        raise GDACSAPIError("API Error: Used an invalid `event_type` parameter in request.")
+
+
+def _validate_event_list(event_list: str = None):
+    """ Raise if `event_list` is not a comma-separated list of known GDACS event types. """
+    if not event_list:
+        return
+    if not isinstance(event_list, str):
+        raise ValueError(f"API Error: event_list must be a string, got {type(event_list).__name__}")
+    _validate_event_types(event_list)
+
+
+@lru_cache(maxsize=64)
+def _validate_event_types(event_list: str):
+    """
+    Check every entry of a non-empty `event_list` string. Valid lists are memoized, so
+    repeated (e.g. paginated) queries skip the work.
+    """
+    for et in event_list.split(','):
+        et = et.strip()
+        if et not in EVENT_TYPES:
+            raise ValueError(f"API Error: Invalid event type '{et}' in event_list")
+
+
+def _validate_alert_level(alert_level: str = None):
+    """ Raise if `alert_level` is not a known GDACS alert level. """
+    if alert_level and alert_level not in ALERT_LEVELS:
+        raise ValueError(f"API Error: Invalid alert level '{alert_level}' in alert_level")
+
+
+@lru_cache(maxsize=256)
+def _validate_wkt(geometry_area: str):
+    """ Raise if `geometry_area` is not a valid WKT string. Valid strings are memoized. """
+    try:
+        from_wkt(geometry_area)
+    except (AttributeError, TypeError) as e:
+        raise ValueError(f"API Error: Invalid geometry_area '{geometry_area}'") from e
+    except Exception as e:
+        raise GDACSAPIError(f"API Error: {e}") from e
+
+
+def _build_url(url: str, params: dict) -> str:
+    """ Append `params` to `url` as an already encoded query string. """
+    return f"{url}?{urlencode(params)}" if params else url
+
+
+def _check_response(res,
+                    unreachable_msg: str = "API Error: GDACS API can not be reached",
+                    no_content_ok: bool = False,
+                    not_found_msg: str = None
+                    ) -> int:
+    """
+    Return the HTTP status of `res` if it succeeded: 200, or 204 No Content when
+    `no_content_ok` is set. Otherwise raise GDACSAPIError naming the status and the
+    start of the response text.
+    """
+    status = res.status_code
+    if status == 200 or (status == 204 and no_content_ok):
+        return status
+
+    message = not_found_msg if status == 404 and not_found_msg else unreachable_msg
+    message = f"{message} (HTTP {status})."
+    text = res.text.strip()
+    if text:
+        message = f"{message} Response: {text[:ERROR_TEXT_LIMIT]}"
+    raise GDACSAPIError(message)
+
+
+class _FeatureStream:
+    """
+    Iterator over the features of a streamed GeoJSON response, parsed incrementally. The
+    response is closed once the iterator is exhausted, closed (directly or by leaving a
+    `with` block) or garbage collected, even if never iterated. A fully read response
+    returns its connection to the pool; closing one early drops the connection instead.
+    Without a response (204 No Content) the stream is empty.
+    """
+    __slots__ = ('_res', '_features')
+
+    def __init__(self, res=None):
+        self._res = res
+        if res is None:
+            self._features = iter(())
+        else:
+            res.raw.decode_content = True
+            self._features = ijson.items(res.raw, 'features.item', use_float=True)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._features)
+        except BaseException:  # StopIteration included
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """ Close the underlying response, if any. """
+        if self._res is not None:
+            self._res.close()
+
+
+def _geometry_wkt(geometry_area: Any) -> str:
+    """
+    WKT of `geometry_area`, either a WKT string (validated) or a geometry object with a
+    `wkt` property such as a pygeoif or shapely geometry (serialized).
+    """
+    if hasattr(geometry_area, 'wkt'):
+        return geometry_area.wkt
+
+    # reject non-strings (possibly unhashable) before the memoized validation
+    if not isinstance(geometry_area, str):
+        raise ValueError(f"API Error: Invalid geometry_area '{geometry_area}'")
+
+    _validate_wkt(geometry_area)
+    return geometry_area
+
+
+def _filter_events_4app(features: list, event_type: str = None, limit: int = None) -> GeoJSON:
+    """ Filter the EVENTS4APP feed by `event_type` and cap it at `limit` features. """
+    if event_type is None:
+        return GeoJSON(features=features[:limit])
+
+    events = (event for event in features if event['properties']['eventtype'] == event_type)
+    if limit is not None and limit < 0:
+        # negative limits count from the end, so the whole feed has to be scanned
+        return GeoJSON(features=list(events)[:limit])
+
+    # stop scanning the feed as soon as `limit` matching events are collected
+    return GeoJSON(features=list(islice(events, limit)))
+
+
+def _latest_events_params(event_list: str = None,
+                          alert_level: str = None,
+                          date_modified: str = None,
+                          country: str = None,
+                          severity: int = None,
+                          page_size: int = 100,
+                          page_number: int = 1,
+                          ) -> dict:
+    """ Build the query parameters of the `latest` endpoint, leaving out None values. """
+    params = {}
+    if event_list is not None:
+        params['eventlist'] = event_list
+    if alert_level is not None:
+        params['alertlevel'] = alert_level
+    if date_modified is not None:
+        params['datemodified'] = date_modified
+    if country is not None:
+        params['country'] = country
+    if severity is not None:
+        params['severity'] = severity
+    if page_size is not None:
+        params['pagesize'] = page_size
+    if page_number is not None:
+        params['pagenumber'] = page_number
+    return params
+
+
+def _events_by_area_params(geometry_area: str, days: int = None) -> dict:
+    """ Build the query parameters of the `eventsbyarea` endpoint, leaving out None values. """
+    params = {'geometryArea': geometry_area}
+    if days is not None:
+        params['days'] = days
+    return params
+
+
+def _events_data_params(event_id: int, event_type: str, source: str = None) -> dict:
+    """ Build the query parameters of the `geteventdata` endpoint, leaving out None values. """
+    params = {}
+    if event_id is not None:
+        params['eventid'] = event_id
+    if event_type is not None:
+        params['eventtype'] = event_type
+    if source is not None:
+        params['source'] = source
+    return params
 
 
 
 class GDACSAPIReader:
-    def __init__(self):
-        pass
+    __slots__ = (
+        '_session',
+        '_cache_lock',
+        '_inflight',
+        '_cache_latest_events_4app',
+        '_cache_latest_events',
+        '_cache_events_by_area',
+        '_cache_events_data',
+        '_cache_event',
+        '__weakref__',
+    )
+
+    def __init__(self, warmup: bool = False):
+        """
+        Args:
+            warmup (bool, optional): Open a connection to the GDACS API up front, paying the
+                DNS and TLS handshake cost here instead of on the first request. Defaults to False.
+        """
+        # share one session so repeated calls reuse keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update({'Connection': 'keep-alive'})
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,  # surface the final response as GDACSAPIError
+            )
+        )
+        self._session.mount('https://', adapter)
+        if warmup:
+            # no retries, so the constructor is bounded by WARMUP_TIMEOUT; the connection
+            # is opened through the mounted adapter so it lands in the reused pool
+            retries = adapter.max_retries
+            adapter.max_retries = Retry(0, read=False)
+            try:
+                self._session.head(API_BASE_URL, timeout=WARMUP_TIMEOUT)
+            except requests.RequestException:
+                pass  # best effort, the first real request connects again
+            finally:
+                adapter.max_retries = retries
+
+        # per-instance caches, keyed on the call arguments only; cachetools caches are not
+        # thread-safe, so their bookkeeping is serialized by a lock (HTTP calls are not)
+        self._cache_lock = threading.RLock()
+        self._inflight = {}
+        self._cache_latest_events_4app = LazyTTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+        self._cache_latest_events = LazyTTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+        self._cache_events_by_area = LazyTTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+        self._cache_events_data = LazyTTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
+        self._cache_event = LazyTTLCache(maxsize=CACHE_SIZE, ttl=CACHE_TTL)
 
     def __repr__(self) -> str:
         return "GDACS API Client."
 
-    @cached(cache=TTLCache(maxsize=500, ttl=CACHE_TTL))
+    def get_metrics(self) -> dict:
+        """ Hit, miss and eviction counts of the response cache of each endpoint. """
+        with self._cache_lock:
+            return {
+                'latest_events_4app': self._cache_latest_events_4app.metrics(),
+                'latest_events': self._cache_latest_events.metrics(),
+                'get_events_by_area': self._cache_events_by_area.metrics(),
+                'get_events_data': self._cache_events_data.metrics(),
+                'get_event': self._cache_event.metrics(),
+            }
+
+    @_cached_request('_cache_latest_events_4app')
     def latest_events_4app(self,
                       event_type: str = None,
                       limit: int = None
                       ):
         """ Get latest events from GDACS RSS feed. """
-        if event_type not in EVENT_TYPES:
-            raise GDACSAPIError("API Error: Used an invalid `event_type` parameter in request.")
+        _validate_event_type(event_type)
 
-        res = requests.get(LATEST_EVENTS_URL_4APP)
-        if res.status_code != 200:
-            raise GDACSAPIError("API Error: GDACS RSS feed can not be reached.")
+        res = self._session.get(LATEST_EVENTS_URL_4APP)
+        _check_response(res, "API Error: GDACS RSS feed can not be reached")
 
-        events = [
-            event for event in res.json()['features']
-            if event_type in [None, event['properties']['eventtype']]
-        ]
-        features = json.loads(json.dumps(events[:limit]))
-        return GeoJSON(features=features)
+        return _filter_events_4app(orjson.loads(res.content)['features'], event_type, limit)
 
-    @cached(cache=TTLCache(maxsize=500, ttl=CACHE_TTL))
+    @_cached_request('_cache_latest_events')
     def latest_events(self,
                       event_list: str = None,
                       alert_level: str = None,
@@ -78,42 +414,23 @@ class GDACSAPIReader:
             GDACSAPIError: If the API request fails or returns an error.
         """
 
-        if event_list:
-            event_types = [et.strip() for et in event_list.split(',')]
-            for et in event_types:
-                if et not in EVENT_TYPES:
-                    raise ValueError(f"API Error: Invalid event type '{et}' in event_list")
-
-        if alert_level and alert_level not in ALERT_LEVELS:
-            raise ValueError(f"API Error: Invalid alert level '{alert_level}' in alert_level")
+        _validate_event_list(event_list)
+        _validate_alert_level(alert_level)
 
         # Build query parameters
-        params = {
-            'eventlist': event_list,
-            'alertlevel': alert_level,
-            'datemodified': date_modified,
-            'country': country,
-            'severity': severity,
-            'pagesize': page_size,
-            'pagenumber': page_number
-        }
-
-        # Remove None values
-        params = {k: v for k, v in params.items() if v is not None}
+        params = _latest_events_params(event_list, alert_level, date_modified, country,
+                                       severity, page_size, page_number)
 
         # Make API request
-        res = requests.get(LATEST_EVENTS_URL, params=params)
-        if res.status_code == 204:
+        res = self._session.get(_build_url(LATEST_EVENTS_URL, params))
+        if _check_response(res, no_content_ok=True) == 204:
             return GeoJSON(features=[])
-        if res.status_code != 200:
-            raise GDACSAPIError("API Error: GDACS API can not be reached.")
 
-        return GeoJSON(features=res.json()['features'])
+        return GeoJSON(features=orjson.loads(res.content)['features'])
 
 
-    @cached(cache=TTLCache(maxsize=500, ttl=CACHE_TTL))
     def get_events_by_area(self,
-                           geometry_area: str,
+                           geometry_area: Any,
                            days: int = None
                            ):
         """
@@ -122,8 +439,9 @@ class GDACSAPIReader:
         computations or data fetches.
 
         Args:
-        geometry_area: A string representation of the geographic area for which events
-            are to be retrieved in WKT format.
+        geometry_area: The geographic area for which events are to be retrieved, either
+            as a WKT string or as a geometry object with a `wkt` property (e.g. pygeoif
+            or shapely), which is serialized once instead of being re-parsed.
         days: Optional integer value for the number of past days to include in the query.
             If not provided, a default behavior is applied according to implementation.
 
@@ -136,54 +454,102 @@ class GDACSAPIReader:
             required formats.
         GDACSAPIError: If the API request fails or returns an error.
         """
-        # validate that geometry_area is a valid WKT string
-        try:
-            from_wkt(geometry_area)
-        except (AttributeError, TypeError) as e:
-            raise ValueError(f"API Error: Invalid geometry_area '{geometry_area}'") from e
-        except Exception as e:
-            raise GDACSAPIError(f"API Error: {e}") from e
-
-        params = {
-            'geometryArea': geometry_area,
-            'days': days
-        }
-
-        res = requests.get(EVENTS_BY_AREA_URL, params=params)
-        if res.status_code == 204:
+        # geometry objects are not hashable, so the cache is keyed on their WKT
+        return self._get_events_by_area(_geometry_wkt(geometry_area), days)
+
+    @_cached_request('_cache_events_by_area')
+    def _get_events_by_area(self, geometry_area: str, days: int = None):
+        params = _events_by_area_params(geometry_area, days)
+
+        res = self._session.get(_build_url(EVENTS_BY_AREA_URL, params))
+        if _check_response(res, no_content_ok=True) == 204:
             return GeoJSON(features=[])
+        return GeoJSON(features=orjson.loads(res.content)['features'])
+
+    def iter_latest_events(self,
+                           event_list: str = None,
+                           alert_level: str = None,
+                           date_modified: str = None,
+                           country: str = None,
+                           severity: int = None,
+                           page_size: int = 100,
+                           page_number: int = 1,
+                           ):
+        """
+        Stream the latest events one feature at a time instead of loading the whole response,
+        taking the same arguments as `latest_events`. Results are not cached.
+        Requires `pip install gdacs-api[stream]`.
+
+        Returns:
+            Iterator[dict]: The GeoJSON features, parsed incrementally from the response body.
+            Call its `close()` (or use it in a `with` block) when not iterating to the end.
+
+        Raises:
+            ValueError: Raised if the input parameters are invalid.
+            GDACSAPIError: If the API request fails or returns an error.
+        """
+        if ijson is None:
+            raise ImportError("Streaming requires ijson: pip install gdacs-api[stream]")
+
+        _validate_event_list(event_list)
+        _validate_alert_level(alert_level)
+
+        params = _latest_events_params(event_list, alert_level, date_modified, country,
+                                       severity, page_size, page_number)
+
+        res = self._session.get(_build_url(LATEST_EVENTS_URL, params), stream=True)
         if res.status_code != 200:
-            raise GDACSAPIError("API Error: GDACS API can not be reached.")
-        return GeoJSON(features=res.json()['features'])
+            with res:
+                _check_response(res, no_content_ok=True)
+            return _FeatureStream()
+        return _FeatureStream(res)
+
+    def iter_events_by_area(self,
+                            geometry_area: Any,
+                            days: int = None
+                            ):
+        """
+        Stream the events of a WKT area one feature at a time instead of loading the whole
+        response, taking the same arguments as `get_events_by_area`. Results are not cached.
+        Requires `pip install gdacs-api[stream]`.
+
+        Returns:
+            Iterator[dict]: The GeoJSON features, parsed incrementally from the response body.
+            Call its `close()` (or use it in a `with` block) when not iterating to the end.
 
+        Raises:
+            ValueError: Raised if the input parameters are invalid.
+            GDACSAPIError: If the API request fails or returns an error.
+        """
+        if ijson is None:
+            raise ImportError("Streaming requires ijson: pip install gdacs-api[stream]")
+
+        params = _events_by_area_params(_geometry_wkt(geometry_area), days)
 
-    @cached(cache=TTLCache(maxsize=500, ttl=CACHE_TTL))
+        res = self._session.get(_build_url(EVENTS_BY_AREA_URL, params), stream=True)
+        if res.status_code != 200:
+            with res:
+                _check_response(res, no_content_ok=True)
+            return _FeatureStream()
+        return _FeatureStream(res)
+
+    @_cached_request('_cache_events_data')
     def get_events_data(self,
                         event_id: int,
                         event_type: str,
                         source: str = None,
                         ):
         """ Get data of a single event from GDACS API. """
-        if event_type not in EVENT_TYPES:
-            raise GDACSAPIError("API Error: Used an invalid `event_type` parameter in request.")
-
-        params = {
-            'eventid': event_id,
-            'eventtype': event_type,
-            'source': source,
-        }
-        # Remove None values
-        params = {k: v for k, v in params.items() if v is not None}
-
-        res = requests.get(EVENTS_DATA_URL, params=params)
-        if res.status_code == 404:
-            raise GDACSAPIError("API Error: Event ID not found.")
-        if res.status_code != 200:
-            raise GDACSAPIError("API Error: GDACS API can not be reached.")
-        return GeoJSON(features=res.json()['features'])
+        _validate_event_type(event_type)
+
+        params = _events_data_params(event_id, event_type, source)
 
+        res = self._session.get(_build_url(EVENTS_DATA_URL, params))
+        _check_response(res, not_found_msg="API Error: Event ID not found")
+        return GeoJSON(features=orjson.loads(res.content)['features'])
 
-    @cached(cache=TTLCache(maxsize=500, ttl=CACHE_TTL))
+
+    @_cached_request('_cache_event')
     def get_event(self,
                   event_id: str,
                   event_type: str = None,
@@ -192,8 +558,7 @@ class GDACSAPIReader:
                   cap_file: bool = False
                   ):
         """ Get record of a single event from GDACS API. """
-        if event_type not in EVENT_TYPES:
-            raise GDACSAPIError("API Error: Used an invalid `event_type` parameter in request.")
+        _validate_event_type(event_type)
 
         if source_format not in DATA_FORMATS:
             raise GDACSAPIError("API Error: Used an invalid `data_format` parameter in request.")
@@ -206,13 +571,11 @@ class GDACSAPIReader:
             return self.__get_xml_event(event_type, event_id, episode_id, cap_file)
 
     def __get_geojson_event(self, event_type: str, event_id: str, episode_id: str = None):
-        file_name = f"geojson_{event_id}_{episode_id}.geojson"
-        geojson_path = join(BASE_URL, event_type, event_id, file_name).replace("\\", "/")
+        geojson_path = f"{BASE_URL}/{event_type}/{event_id}/geojson_{event_id}_{episode_id}.geojson"
         return handle_geojson(geojson_path)        
 
     def __get_shp_event(self, event_type: str, event_id: str, episode_id: str = None):
-        file_name = f"Shape_{event_id}_{episode_id}.zip"
-        shp_path = join(BASE_URL, event_type, event_id, file_name).replace("\\", "/")
+        shp_path = f"{BASE_URL}/{event_type}/{event_id}/Shape_{event_id}_{episode_id}.zip"
         return download_shp(shp_path)
 
     def __get_xml_event(self, event_type: str, event_id: str, episode_id: str = None, cap_file: bool = False):
@@ -223,5 +586,104 @@ class GDACSAPIReader:
         else:
             file_name = f"rss_{event_id}_{episode_id}.xml"
 
-        xml_path = join(BASE_URL, event_type, event_id, file_name).replace("\\", "/")
-        return handle_xml(xml_path)
\ No newline at end of file
+        xml_path = f"{BASE_URL}/{event_type}/{event_id}/{file_name}"
+        return handle_xml(xml_path)
+
+
+class AsyncGDACSAPIReader:
+    """
+    Asynchronous GDACS API client backed by a single long-lived `httpx.AsyncClient`.
+
+    Concurrent calls share persistent HTTP/2 connections, so several requests can be
+    awaited together (e.g. with `asyncio.gather`). Close the client with `aclose()`
+    or use the reader as an async context manager. Requires `pip install gdacs-api[async]`.
+    """
+    __slots__ = ('_client', '__weakref__')
+
+    def __init__(self):
+        if httpx is None:
+            raise ImportError("AsyncGDACSAPIReader requires httpx: pip install gdacs-api[async]")
+
+        # follow redirects and wait without a timeout, as the requests-based reader does
+        self._client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=None,
+            limits=httpx.Limits(
+                max_keepalive_connections=ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+                max_connections=ASYNC_MAX_CONNECTIONS
+            )
+        )
+
+    def __repr__(self) -> str:
+        return "GDACS Async API Client."
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def aclose(self):
+        """ Close the underlying HTTP client and its pooled connections. """
+        await self._client.aclose()
+
+    async def latest_events_4app(self,
+                                 event_type: str = None,
+                                 limit: int = None
+                                 ):
+        """ Get latest events from GDACS RSS feed. """
+        _validate_event_type(event_type)
+
+        res = await self._client.get(LATEST_EVENTS_URL_4APP)
+        _check_response(res, "API Error: GDACS RSS feed can not be reached")
+
+        return _filter_events_4app(orjson.loads(res.content)['features'], event_type, limit)
+
+    async def latest_events(self,
+                            event_list: str = None,
+                            alert_level: str = None,
+                            date_modified: str = None,
+                            country: str = None,
+                            severity: int = None,
+                            page_size: int = 100,
+                            page_number: int = 1,
+                            ):
+        """ Fetch the latest events, see `GDACSAPIReader.latest_events`. """
+        _validate_event_list(event_list)
+        _validate_alert_level(alert_level)
+
+        params = _latest_events_params(event_list, alert_level, date_modified, country,
+                                       severity, page_size, page_number)
+
+        res = await self._client.get(_build_url(LATEST_EVENTS_URL, params))
+        if _check_response(res, no_content_ok=True) == 204:
+            return GeoJSON(features=[])
+
+        return GeoJSON(features=orjson.loads(res.content)['features'])
+
+    async def get_events_by_area(self,
+                                 geometry_area: Any,
+                                 days: int = None
+                                 ):
+        """ Retrieve events for a WKT area, see `GDACSAPIReader.get_events_by_area`. """
+        params = _events_by_area_params(_geometry_wkt(geometry_area), days)
+
+        res = await self._client.get(_build_url(EVENTS_BY_AREA_URL, params))
+        if _check_response(res, no_content_ok=True) == 204:
+            return GeoJSON(features=[])
+        return GeoJSON(features=orjson.loads(res.content)['features'])
+
+    async def get_events_data(self,
+                              event_id: int,
+                              event_type: str,
+                              source: str = None,
+                              ):
+        """ Get data of a single event from GDACS API. """
+        _validate_event_type(event_type)
+
+        params = _events_data_params(event_id, event_type, source)
+
+        res = await self._client.get(_build_url(EVENTS_DATA_URL, params))
+        _check_response(res, not_found_msg="API Error: Event ID not found")
+        return GeoJSON(features=orjson.loads(res.content)['features'])
@@ -1,8 +1,16 @@
-from unittest import TestCase, mock
+import io
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from unittest import IsolatedAsyncioTestCase, TestCase, mock, skipIf
 
-from gdacs.api import GDACSAPIReader, GDACSAPIError
+import requests
+
+from gdacs.api import API_BASE_URL, DEFAULT_CACHE_SIZE, _cache_size_from_env, AsyncGDACSAPIReader, GDACSAPIReader, GDACSAPIError, httpx, ijson
 from gdacs.schemas import GeoJSON
 from gdacs.utils import delete_downloads
+from pygeoif.factories import from_wkt
 
 
 class TestGDACSAPI(TestCase):
@@ -13,6 +21,42 @@ class TestGDACSAPI(TestCase):
         self.client = None
         delete_downloads()
 
+    def test_reader_has_no_instance_dict(self):
+        '''Test GDACSAPIReader declares its attributes in __slots__.'''
+        self.assertFalse(hasattr(self.client, '__dict__'))
+
+    def test_reader_supports_weakref(self):
+        '''Test GDACSAPIReader can still be weakly referenced despite __slots__.'''
+        self.assertIs(weakref.ref(self.client)(), self.client)
+
+    def test_cache_size_from_env(self):
+        '''Test GDACS_CACHE_SIZE is read from the environment, ignoring invalid values.'''
+        for value, expected in (("10", 10), ("0", 0), ("abc", DEFAULT_CACHE_SIZE), ("-1", DEFAULT_CACHE_SIZE)):
+            with mock.patch.dict('os.environ', {'GDACS_CACHE_SIZE': value}):
+                self.assertEqual(_cache_size_from_env(), expected)
+        with mock.patch.dict('os.environ', clear=True):
+            self.assertEqual(_cache_size_from_env(), DEFAULT_CACHE_SIZE)
+
+    def test_reader_warmup(self):
+        '''Test GDACSAPIReader(warmup=True) opens a connection and tolerates failures.'''
+        retries_during_warmup = []
+
+        def head(session, *args, **kwargs):
+            adapter = session.get_adapter(API_BASE_URL)
+            retries_during_warmup.append(adapter.max_retries.total)
+
+        with mock.patch('requests.Session.head', autospec=True, side_effect=head) as mock_head:
+            client = GDACSAPIReader(warmup=True)
+            self.assertEqual(mock_head.call_count, 1)
+            self.assertEqual(retries_during_warmup, [0])  # warm-up is not retried
+            self.assertEqual(client._session.get_adapter(API_BASE_URL).max_retries.total, 3)
+
+            mock_head.side_effect = requests.ConnectionError
+            GDACSAPIReader(warmup=True)
+
+            GDACSAPIReader()
+            self.assertEqual(mock_head.call_count, 2)
+
     def test_latest_events_4app_no_args(self):
         '''Test latest_events_4app() without any arguments.'''
         events = self.client.latest_events_4app()
@@ -26,9 +70,11 @@ class TestGDACSAPI(TestCase):
 
     def test_latest_events_4app_event_types(self):
         ''' Test latest_events_4app() filter by event_types argument. '''
-        for event_type in ["TC", "EQ", "FL", "DR", "WF", "VO"]:
-            events = self.client.latest_events_4app(event_type=event_type) 
-            self.assertTrue(events) if len(events) > 0 else self.assertFalse(events)
+        event_types = ["TC", "EQ", "FL", "DR", "WF", "VO"]
+        with ThreadPoolExecutor(max_workers=len(event_types)) as executor:
+            results = executor.map(lambda et: self.client.latest_events_4app(event_type=et), event_types)
+            for events in results:
+                self.assertTrue(events) if len(events) > 0 else self.assertFalse(events)
     
     def test_latest_events_4app_multiple_args(self):
         ''' Test latest_events_4app() with multiple argumnets defined. '''
@@ -36,6 +82,21 @@ class TestGDACSAPI(TestCase):
         self.assertTrue(events) if len(events) > 0 else self.assertFalse(events)
         self.assertEqual(len(events), 5) if len(events) == 5 else self.assertFalse(events)
 
+    def test_latest_events_4app_negative_limit(self):
+        ''' Test latest_events_4app() keeps slice semantics for a negative limit. '''
+        with mock.patch('requests.Session.get') as mock_get:
+            mock_response = mock.Mock()
+            mock_response.status_code = 200
+            mock_response.content = (
+                b'{"features": [{"properties": {"eventtype": "EQ", "eventid": 1}},'
+                b' {"properties": {"eventtype": "TC", "eventid": 2}},'
+                b' {"properties": {"eventtype": "EQ", "eventid": 3}}]}'
+            )
+            mock_get.return_value = mock_response
+
+            events = self.client.latest_events_4app(event_type="EQ", limit=-1)
+            self.assertEqual([e['properties']['eventid'] for e in events.features], [1])
+
     def test_get_event_for_different_events(self):
         self.assertTrue(
             self.client.get_event(event_type='TC', event_id='1000132')
@@ -93,12 +154,14 @@ class TestGDACSAPI(TestCase):
 
     def test_latest_events_filter_by_event_type(self):
         '''Test latest_events() filter by event_list parameter.'''
-        for event_type in ["TC", "EQ", "FL", "DR", "WF", "VO"]:
-            events = self.client.latest_events(event_list=event_type)
-            # Check that all returned events match the filter
-            if len(events) > 0:
-                for event in events.features:
-                    self.assertEqual(event['properties']['eventtype'], event_type)
+        event_types = ["TC", "EQ", "FL", "DR", "WF", "VO"]
+        with ThreadPoolExecutor(max_workers=len(event_types)) as executor:
+            results = executor.map(lambda et: self.client.latest_events(event_list=et), event_types)
+            for event_type, events in zip(event_types, results):
+                # Check that all returned events match the filter
+                if len(events) > 0:
+                    for event in events.features:
+                        self.assertEqual(event['properties']['eventtype'], event_type)
 
     def test_latest_events_filter_by_multiple_event_types(self):
         '''Test latest_events() filter by multiple event types.'''
@@ -110,12 +173,14 @@ class TestGDACSAPI(TestCase):
 
     def test_latest_events_filter_by_alert_level(self):
         '''Test latest_events() filter by alert_level parameter.'''
-        for level in ["green", "orange", "red"]:
-            events = self.client.latest_events(alert_level=level)
-            # Check that all returned events match the filter
-            if len(events) > 0:
-                for event in events.features:
-                    self.assertEqual(event['properties']['alertlevel'], level.capitalize())
+        levels = ["green", "orange", "red"]
+        with ThreadPoolExecutor(max_workers=len(levels)) as executor:
+            results = executor.map(lambda level: self.client.latest_events(alert_level=level), levels)
+            for level, events in zip(levels, results):
+                # Check that all returned events match the filter
+                if len(events) > 0:
+                    for event in events.features:
+                        self.assertEqual(event['properties']['alertlevel'], level.capitalize())
 
     def test_latest_events_filter_by_country(self):
         '''Test latest_events() filter by country parameter.'''
@@ -174,6 +239,11 @@ class TestGDACSAPI(TestCase):
         with self.assertRaises(ValueError):
             self.client.latest_events(event_list="INVALID")
 
+    def test_latest_events_non_string_event_list(self):
+        '''Test latest_events() rejects an event_list that is not a string.'''
+        with self.assertRaises(ValueError):
+            self.client.latest_events(event_list=("EQ", "TC"))
+
     def test_latest_events_invalid_alert_level(self):
         '''Test latest_events() with invalid alert level.'''
         with self.assertRaises(ValueError):
@@ -181,25 +251,39 @@ class TestGDACSAPI(TestCase):
 
     def test_latest_events_api_error(self):
         '''Test handling of API errors in latest_events().'''
-        # Mock the requests.get to simulate an API error
-        with mock.patch('requests.get') as mock_get:
+        # Mock the requests.Session.get to simulate an API error
+        with mock.patch('requests.Session.get') as mock_get:
             mock_response = mock.Mock()
             mock_response.status_code = 500
+            mock_response.text = ""
             mock_get.return_value = mock_response
 
-            with self.assertRaises(GDACSAPIError):
+            with self.assertRaisesRegex(GDACSAPIError, "HTTP 500"):
                 self.client.latest_events()
 
+    def test_get_events_data_not_found(self):
+        '''Test a 404 in get_events_data() raises GDACSAPIError quoting the response text.'''
+        with mock.patch('requests.Session.get') as mock_get:
+            mock_response = mock.Mock()
+            mock_response.status_code = 404
+            mock_response.text = "Event not found"
+            mock_get.return_value = mock_response
+
+            with self.assertRaisesRegex(GDACSAPIError, r"not found \(HTTP 404\)\. Response: Event not found"):
+                self.client.get_events_data(event_id=1, event_type="EQ")
+
     def test_latest_events_no_content(self):
         '''Test handling of 204 No Content response in latest_events().'''
-        # Mock the requests.get to simulate a 204 response
-        with mock.patch('requests.get') as mock_get:
+        # Mock the requests.Session.get to simulate a 204 response
+        with mock.patch('requests.Session.get') as mock_get:
             mock_response = mock.Mock()
             mock_response.status_code = 204
+            mock_response.text = ""
             mock_get.return_value = mock_response
 
             events = self.client.latest_events()
             self.assertEqual(len(events.features), 0)
+            self.assertIsInstance(events.features, list)
 
     def test_get_events_by_area_point(self):
         '''Test get_events_by_area() with a point geometry.'''
@@ -260,6 +344,11 @@ class TestGDACSAPI(TestCase):
         with self.assertRaises(ValueError):
             self.client.get_events_by_area(geometry_area=None)
 
+    def test_get_events_by_area_unhashable_wkt(self):
+        '''Test get_events_by_area() with an unhashable geometry_area.'''
+        with self.assertRaises(ValueError):
+            self.client.get_events_by_area(geometry_area=["POINT(0 0)"])
+
     def test_get_events_by_area_invalid_days(self):
         '''Test get_events_by_area() with invalid days parameter.'''
         point_wkt = "POINT(0 0)"
@@ -274,10 +363,11 @@ class TestGDACSAPI(TestCase):
     def test_get_events_by_area_api_error(self):
         '''Test handling of API errors in get_events_by_area().'''
         valid_wkt = "POINT(0 0)"
-        # Mock the requests.get to simulate an API error
-        with mock.patch('requests.get') as mock_get:
+        # Mock the requests.Session.get to simulate an API error
+        with mock.patch('requests.Session.get') as mock_get:
             mock_response = mock.Mock()
             mock_response.status_code = 500
+            mock_response.text = ""
             mock_get.return_value = mock_response
 
             with self.assertRaises(GDACSAPIError):
@@ -301,31 +391,205 @@ class TestGDACSAPI(TestCase):
         point_wkt = "POINT(0 0)"
 
         # First call should make a real API request
-        with mock.patch('requests.get') as mock_get:
+        with mock.patch('requests.Session.get') as mock_get:
             mock_response = mock.Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {'features': []}
+            mock_response.content = b'{"features": []}'
             mock_get.return_value = mock_response
 
             self.client.get_events_by_area(geometry_area=point_wkt)
             self.assertEqual(mock_get.call_count, 1)
 
         # Second call with same parameters should use cache
-        with mock.patch('requests.get') as mock_get:
+        with mock.patch('requests.Session.get') as mock_get:
             mock_response = mock.Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {'features': []}
+            mock_response.content = b'{"features": []}'
             mock_get.return_value = mock_response
 
             self.client.get_events_by_area(geometry_area=point_wkt)
             self.assertEqual(mock_get.call_count, 0)  # No new API calls
 
         # Call with different parameters should make a new API request
-        with mock.patch('requests.get') as mock_get:
+        with mock.patch('requests.Session.get') as mock_get:
             mock_response = mock.Mock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {'features': []}
+            mock_response.content = b'{"features": []}'
             mock_get.return_value = mock_response
 
             self.client.get_events_by_area(geometry_area=point_wkt, days=7)
-            self.assertEqual(mock_get.call_count, 1)
\ No newline at end of file
+            self.assertEqual(mock_get.call_count, 1)
+
+        metrics = self.client.get_metrics()['get_events_by_area']
+        self.assertEqual((metrics['hits'], metrics['misses']), (1, 2))
+
+
+    def test_get_events_by_area_geometry_object(self):
+        '''Test get_events_by_area() with a geometry object instead of a WKT string.'''
+        point = from_wkt("POINT(0 0)")
+        with mock.patch('requests.Session.get') as mock_get:
+            mock_response = mock.Mock()
+            mock_response.status_code = 200
+            mock_response.content = b'{"features": []}'
+            mock_get.return_value = mock_response
+
+            events = self.client.get_events_by_area(geometry_area=point)
+            self.assertIsInstance(events, GeoJSON)
+            self.assertIn("geometryArea=POINT", mock_get.call_args.args[0])
+
+            # the equivalent WKT string is served from the same cache entry
+            self.client.get_events_by_area(geometry_area=point.wkt)
+            self.assertEqual(mock_get.call_count, 1)
+
+    def test_get_events_by_area_concurrent_misses(self):
+        '''Test concurrent identical calls of get_events_by_area() share one API request.'''
+        point_wkt = "POINT(0 0)"
+        started = threading.Event()
+
+        def slow_get(*args, **kwargs):
+            started.set()
+            time.sleep(0.2)  # keep the first request in flight
+            mock_response = mock.Mock()
+            mock_response.status_code = 200
+            mock_response.content = b'{"features": []}'
+            return mock_response
+
+        with mock.patch('requests.Session.get', side_effect=slow_get) as mock_get:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                first = executor.submit(self.client.get_events_by_area, geometry_area=point_wkt)
+                started.wait()
+                others = [
+                    executor.submit(self.client.get_events_by_area, geometry_area=point_wkt)
+                    for _ in range(3)
+                ]
+                results = [first.result()] + [future.result() for future in others]
+
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertTrue(all(result is results[0] for result in results))
+
+    @skipIf(ijson is None, "ijson is not installed")
+    def test_iter_latest_events(self):
+        '''Test iter_latest_events() yields features from a streamed response.'''
+        with mock.patch('requests.Session.get') as mock_get:
+            mock_response = mock.MagicMock()
+            mock_response.status_code = 200
+            mock_response.raw = io.BytesIO(
+                b'{"type": "FeatureCollection", "features": ['
+                b'{"properties": {"eventtype": "EQ"}}, {"properties": {"eventtype": "TC"}}]}'
+            )
+            mock_get.return_value = mock_response
+
+            events = list(self.client.iter_latest_events(event_list="EQ,TC"))
+            self.assertEqual([e['properties']['eventtype'] for e in events], ["EQ", "TC"])
+            self.assertTrue(mock_get.call_args.kwargs['stream'])
+
+    @skipIf(ijson is None, "ijson is not installed")
+    def test_iter_latest_events_closes_response(self):
+        '''Test iter_latest_events() releases the response when exhausted, closed or dropped.'''
+        with mock.patch('requests.Session.get') as mock_get:
+            mock_response = mock.MagicMock()
+            mock_response.status_code = 200
+            mock_response.raw = io.BytesIO(b'{"features": [{"properties": {}}]}')
+            mock_get.return_value = mock_response
+
+            features = self.client.iter_latest_events()
+            list(features)
+            self.assertTrue(mock_response.close.called)  # closed on exhaustion, not on GC
+
+            mock_response.reset_mock()
+            mock_response.raw = io.BytesIO(b'{"features": [{"properties": {}}]}')
+            with self.client.iter_latest_events():
+                pass
+            self.assertTrue(mock_response.close.called)
+
+            mock_response.reset_mock()
+            mock_response.raw = io.BytesIO(b'{"features": [{"properties": {}}]}')
+            self.client.iter_latest_events()  # never iterated, dropped right away
+            self.assertTrue(mock_response.close.called)
+
+    @skipIf(ijson is None, "ijson is not installed")
+    def test_iter_events_by_area_no_content(self):
+        '''Test iter_events_by_area() returns an empty, closable stream on 204 No Content.'''
+        with mock.patch('requests.Session.get') as mock_get:
+            mock_response = mock.MagicMock()
+            mock_response.status_code = 204
+            mock_response.text = ""
+            mock_get.return_value = mock_response
+
+            with self.client.iter_events_by_area(geometry_area="POINT(0 0)") as features:
+                self.assertEqual(list(features), [])
+            self.assertTrue(mock_response.__exit__.called)  # response released
+
+    @skipIf(ijson is None, "ijson is not installed")
+    def test_iter_events_by_area_api_error(self):
+        '''Test handling of API errors in iter_events_by_area().'''
+        with mock.patch('requests.Session.get') as mock_get:
+            mock_response = mock.MagicMock()
+            mock_response.status_code = 500
+            mock_response.text = ""
+            mock_get.return_value = mock_response
+
+            with self.assertRaises(GDACSAPIError):
+                self.client.iter_events_by_area(geometry_area="POINT(0 0)")
+
+@skipIf(httpx is None, "httpx is not installed")
+class TestAsyncGDACSAPI(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.client = AsyncGDACSAPIReader()
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+
+    async def test_latest_events_api_error(self):
+        '''Test handling of API errors in async latest_events().'''
+        with mock.patch.object(self.client._client, 'get') as mock_get:
+            mock_response = mock.Mock()
+            mock_response.status_code = 500
+            mock_response.text = ""
+            mock_get.return_value = mock_response
+
+            with self.assertRaises(GDACSAPIError):
+                await self.client.latest_events()
+
+    async def test_latest_events(self):
+        '''Test async latest_events() decodes the features of a 200 response.'''
+        response = httpx.Response(
+            200,
+            content=b'{"features": [{"properties": {"eventtype": "EQ", "eventid": 1}}]}',
+            request=httpx.Request('GET', 'https://www.gdacs.org/gdacsapi'),
+        )
+        with mock.patch.object(self.client._client, 'get', return_value=response):
+            events = await self.client.latest_events(event_list="EQ")
+            self.assertIsInstance(events, GeoJSON)
+            self.assertEqual(events.features, [{"properties": {"eventtype": "EQ", "eventid": 1}}])
+
+    def test_client_matches_sync_reader_defaults(self):
+        '''Test the async client follows redirects and has no timeout, like requests.'''
+        self.assertTrue(self.client._client.follow_redirects)
+        self.assertIsNone(self.client._client.timeout.read)
+
+    async def test_latest_events_no_content(self):
+        '''Test handling of 204 No Content response in async latest_events().'''
+        with mock.patch.object(self.client._client, 'get') as mock_get:
+            mock_response = mock.Mock()
+            mock_response.status_code = 204
+            mock_response.text = ""
+            mock_get.return_value = mock_response
+
+            events = await self.client.latest_events()
+            self.assertEqual(len(events.features), 0)
+
+    async def test_latest_events_invalid_event_type(self):
+        '''Test async latest_events() with invalid event type.'''
+        with self.assertRaises(ValueError):
+            await self.client.latest_events(event_list="INVALID")
+
+    async def test_latest_events_non_string_event_list(self):
+        '''Test async latest_events() rejects an event_list that is not a string.'''
+        with self.assertRaises(ValueError):
+            await self.client.latest_events(event_list=["EQ", "TC"])
+
+    async def test_get_events_by_area_invalid_wkt(self):
+        '''Test async get_events_by_area() with invalid WKT string.'''
+        with self.assertRaises(ValueError):
+            await self.client.get_events_by_area(geometry_area="NOT A WKT STRING")
@@ -63,6 +63,62 @@ class TestUtils(TestCase):
         with self.assertRaises(GDACSAPIError):
             download_shp(url)
 
+    def test_lazy_ttl_cache(self):
+        """
+        Test the LazyTTLCache LRU eviction, expiry and eviction counter
+        :return:
+        """
+        clock = [0]
+        cache = LazyTTLCache(maxsize=2, ttl=60, timer=lambda: clock[0])
+        cache['a'] = 1
+        cache['b'] = 2
+        self.assertEqual(cache['a'], 1)
+        cache['c'] = 3  # evicts 'b', the least recently used
+        self.assertNotIn('b', cache)
+        clock[0] = 30
+        self.assertEqual(cache.get('a'), 1)
+        clock[0] = 60
+        with self.assertRaises(KeyError):
+            cache['a']  # expired on lookup
+        self.assertIsNone(cache.get('c'))
+        self.assertEqual(
+            cache.metrics(),
+            {'hits': 0, 'misses': 0, 'evictions': 3, 'currsize': 0, 'maxsize': 2}
+        )
+
+    def test_lazy_ttl_cache_mapping(self):
+        """
+        Test the LazyTTLCache membership, views and pop skip expired items
+        :return:
+        """
+        clock = [0]
+        cache = LazyTTLCache(maxsize=3, ttl=60, timer=lambda: clock[0])
+        cache['a'] = 1
+        clock[0] = 30
+        cache['b'] = 2
+        clock[0] = 60  # 'a' has expired, 'b' has not
+        self.assertNotIn('a', cache)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(list(cache.items()), [('b', 2)])
+        self.assertEqual(list(cache.values()), [2])
+        self.assertEqual(cache.pop('a', None), None)
+        with self.assertRaises(KeyError):
+            cache.pop('a')
+        self.assertEqual(cache.pop('b'), 2)
+        self.assertEqual(cache.metrics()['currsize'], 0)
+
+    def test_lazy_ttl_cache_expiring_between_reads(self):
+        """
+        Test LazyTTLCache get, pop and setdefault when an item expires during the call
+        :return:
+        """
+        for method in ('get', 'pop', 'setdefault'):
+            # stored at 0, still live at the first read after it, expired at any later read
+            times = iter([0, 59.99, 60.1, 60.1])
+            cache = LazyTTLCache(maxsize=2, ttl=60, timer=lambda: next(times))
+            cache['a'] = 1
+            self.assertEqual(getattr(cache, method)('a', 'x'), 1)
+
     def test_delete_downloads(self):
         """
         Test the delete_downloads function
@@ -1,21 +1,147 @@
 import os
 import glob
+import collections
 import json
+import time
+import orjson
 import requests
 import xmltodict
+from cachetools import Cache
 
 
 class GDACSAPIError(RuntimeError):
     pass
 
 
+class LazyTTLCache(Cache):
+    """
+    LRU cache whose items expire `ttl` seconds after they are stored. There is no
+    expiration sweep on writes: an expired item is dropped when it is looked up, when it
+    is evicted as least recently used, or by `expire()`. Membership, iteration and len()
+    skip expired items; iteration and len() check every stored item, so they are O(n).
+    Evictions are counted here, hits and misses by the caller.
+    """
+    __marker = object()
+
+    def __init__(self, maxsize, ttl, timer=time.monotonic, getsizeof=None):
+        super().__init__(maxsize, getsizeof)
+        self.__order = collections.OrderedDict()
+        self.__ttl = ttl
+        self.__timer = timer
+        self.hits = self.misses = self.evictions = 0
+
+    def __getitem__(self, key):
+        value, expires = super().__getitem__(key)
+        if not self.__timer() < expires:
+            self.__delitem__(key)
+            self.evictions += 1
+            return self.__missing__(key)
+        self.__order.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, (value, self.__timer() + self.__ttl))
+        self.__order[key] = None
+        self.__order.move_to_end(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        del self.__order[key]
+
+    def __contains__(self, key):
+        try:
+            _, expires = super().__getitem__(key)
+        except KeyError:
+            return False
+        return self.__timer() < expires
+
+    def __iter__(self):
+        time = self.__timer()
+        return iter([key for key in Cache.__iter__(self) if time < Cache.__getitem__(self, key)[1]])
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __bool__(self):
+        # stops at the first live item instead of counting them all
+        time = self.__timer()
+        return any(time < Cache.__getitem__(self, key)[1] for key in Cache.__iter__(self))
+
+    # Cache.get(), pop() and setdefault() check membership and then look the item up,
+    # reading the timer twice; an item expiring in between would raise KeyError. These
+    # versions read each item once.
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def pop(self, key, default=__marker):
+        try:
+            value = self[key]
+        except KeyError:
+            if default is self.__marker:
+                raise
+            return default
+        self.__delitem__(key)
+        return value
+
+    def setdefault(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def popitem(self):
+        """ Remove and return the least recently used `(key, value)` pair, expired or not. """
+        try:
+            key = next(iter(self.__order))
+        except StopIteration:
+            raise KeyError(f"{type(self).__name__} is empty") from None
+        value, _ = super().__getitem__(key)
+        self.__delitem__(key)
+        self.evictions += 1
+        return (key, value)
+
+    def clear(self):
+        super().clear()
+        self.__order.clear()
+
+    def expire(self) -> int:
+        """ Remove all expired items and return how many were removed. """
+        time = self.__timer()
+        expired = [key for key in Cache.__iter__(self) if not time < Cache.__getitem__(self, key)[1]]
+        for key in expired:
+            self.__delitem__(key)
+        self.evictions += len(expired)
+        return len(expired)
+
+    @property
+    def ttl(self):
+        """ The time-to-live value of the cache's items. """
+        return self.__ttl
+
+    def metrics(self) -> dict:
+        """ Current counters and fill level of the cache, after dropping expired items. """
+        self.expire()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'currsize': self.currsize,
+            'maxsize': self.maxsize,
+        }
+
+
 def handle_geojson(endpoint):
     """ Handle GeoJSON file data types. """
     res = requests.get(endpoint)
     if res.status_code != 200:
         raise GDACSAPIError("API Error: Unable to read GeoJSON data for GDACS event.")
 
-    return json.loads(res.content)
+    return orjson.loads(res.content)
 
 
 def handle_xml(endpoint):
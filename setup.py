@@ -31,7 +31,12 @@ setup(
         "xmltodict",
         "cachetools",
         "pydantic",
+        "orjson",
     ],
+    extras_require={
+        "async": ["httpx[http2]"],
+        "stream": ["ijson>=3.1"],
+    },
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",